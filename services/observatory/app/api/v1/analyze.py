@@ -25,6 +25,7 @@ from app.models.schemas import (
     AnalysisResponse,
     AnalysisStatusResponse,
     CancelResponse,
+    PatternData,
 )
 
 router = APIRouter()
@@ -211,12 +212,12 @@ async def get_analysis(
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
-    # Default JSON response (Pydantic model)
-    return AnalysisResponse(
+    # Default JSON response (Pydantic model, DB values are trusted so skip validation)
+    return AnalysisResponse.model_construct(
         id=analysis.id,
         status=analysis.status.value,
         observer_output=analysis.observer_output,
-        patterns=analysis.patterns,
+        patterns=PatternData.model_construct(**analysis.patterns) if analysis.patterns else None,
         summary_points=None,
         confidence_score=analysis.confidence_score,
         processing_time=analysis.processing_time,
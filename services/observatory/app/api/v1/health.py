@@ -67,8 +67,8 @@ async def get_metrics(
     return {
         "tier": tier,
         "rate_limits": {
-            "requests_per_minute": tier_limits["requests_per_minute"],
-            "requests_per_day": tier_limits["requests_per_day"],
+            "requests_per_minute": tier_limits.per_minute,
+            "requests_per_day": tier_limits.per_day,
         },
         "database_stats": {
             "total_analyses": total_analyses or 0,
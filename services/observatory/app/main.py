@@ -8,6 +8,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from app import __version__
 from app.api.v1 import analyze, batch, examples, health
 from app.core.dev_keys import auto_register_dev_keys
+from app.core.responses import ORJSONResponse
 from app.middleware import AuthMiddleware, RateLimitMiddleware
 from app.models.database import init_database, start_cleanup_scheduler, stop_cleanup_scheduler
 
@@ -75,6 +76,7 @@ app = FastAPI(
     version=__version__,
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
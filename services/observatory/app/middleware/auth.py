@@ -3,15 +3,22 @@
 import hashlib
 import secrets
 
-from fastapi import HTTPException, Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.core.config import settings
 from app.core.logging import log_auth_failure, log_auth_success
+from app.core.responses import ORJSONResponse
 
-# In-memory API key registry for Phase 2
+# In-memory API key registry for Phase 2, keyed by raw SHA256 digest
 # Phase 5 will move this to database
-API_KEY_REGISTRY: dict[str, str] = {}
+API_KEY_REGISTRY: dict[bytes, str] = {}
+
+# Salt is fixed for the process lifetime; encode it once
+_SALT_BYTES = settings.api_key_salt.encode()
+
+# Liveness probes and API docs skip auth and rate limiting entirely
+BYPASS_PATHS = frozenset({"/health", "/openapi.json", "/docs", "/redoc"})
 
 
 def generate_api_key() -> str:
@@ -24,7 +31,7 @@ def generate_api_key() -> str:
     return secrets.token_urlsafe(24)[:32]
 
 
-def hash_api_key(api_key: str) -> str:
+def hash_api_key(api_key: str) -> bytes:
     """
     Hash an API key for secure storage.
 
@@ -32,19 +39,18 @@ def hash_api_key(api_key: str) -> str:
         api_key: Plain text API key
 
     Returns:
-        SHA256 hash of the API key with salt
+        Raw 32-byte SHA256 digest of the API key with salt
     """
-    salted = f"{settings.api_key_salt}{api_key}".encode()
-    return hashlib.sha256(salted).hexdigest()
+    return hashlib.sha256(_SALT_BYTES + api_key.encode()).digest()
 
 
-def validate_api_key(api_key: str | None, registry: dict[str, str]) -> bool:
+def validate_api_key(api_key: str | None, registry: dict[bytes, str]) -> bool:
     """
     Validate an API key against the registry.
 
     Args:
         api_key: API key to validate
-        registry: Dictionary of hashed keys to tier names
+        registry: Dictionary of key digests to tier names
 
     Returns:
         True if valid, False otherwise
@@ -68,6 +74,21 @@ def register_api_key(api_key: str, tier: str = "api_key") -> None:
     API_KEY_REGISTRY[hashed] = tier
 
 
+def lookup_api_key(api_key: str | None) -> str | None:
+    """
+    Resolve an API key to its tier with a single hash and dict lookup.
+
+    Args:
+        api_key: Plain text API key
+
+    Returns:
+        Tier name if the key is registered, None otherwise
+    """
+    if not api_key:
+        return None
+    return API_KEY_REGISTRY.get(hash_api_key(api_key))
+
+
 def get_tier_from_api_key(api_key: str) -> str:
     """
     Get the access tier for an API key.
@@ -76,13 +97,12 @@ def get_tier_from_api_key(api_key: str) -> str:
         api_key: Plain text API key
 
     Returns:
-        Tier name (api_key or partner)
+        Tier name (api_key or partner), or "public" for unknown keys
     """
-    hashed = hash_api_key(api_key)
-    return API_KEY_REGISTRY.get(hashed, "public")
+    return lookup_api_key(api_key) or "public"
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
+class AuthMiddleware:
     """
     Authentication middleware for API key validation.
 
@@ -90,46 +110,60 @@ class AuthMiddleware(BaseHTTPMiddleware):
     - No header: tier = "public"
     - Valid API key: tier = "api_key" or "partner"
     - Invalid API key: returns 401 Unauthorized
+
+    Implemented as pure ASGI: the raw header list is scanned for the
+    Authorization header without building a Request/Headers object.
     """
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and validate authentication."""
-        # Get Authorization header
-        auth_header = request.headers.get("Authorization", "")
+        if scope["type"] != "http" or scope["path"] in BYPASS_PATHS:
+            await self.app(scope, receive, send)
+            return
 
         # Default to public tier
         tier = "public"
         api_key = None
 
-        # Parse Bearer token
-        if auth_header.startswith("Bearer "):
-            api_key = auth_header[7:].strip()
+        # Parse Bearer token (ASGI header names are lowercase bytes)
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                if value.startswith(b"Bearer "):
+                    api_key = value[7:].strip().decode("latin-1")
+                break
+
+        if api_key is not None:
+            key_prefix = api_key[:8] if len(api_key) >= 8 else api_key
 
-            # Validate API key
-            if validate_api_key(api_key, API_KEY_REGISTRY):
-                tier = get_tier_from_api_key(api_key)
+            # Validate API key and resolve its tier in one lookup
+            key_tier = lookup_api_key(api_key)
+            if key_tier is not None:
+                tier = key_tier
 
                 # Log successful auth
-                key_prefix = api_key[:8] if len(api_key) >= 8 else api_key
                 log_auth_success(api_key_prefix=key_prefix, tier=tier)
             else:
                 # Invalid API key
-                key_prefix = api_key[:8] if len(api_key) >= 8 else api_key
                 log_auth_failure(api_key_prefix=key_prefix, reason="invalid_key")
 
-                raise HTTPException(
+                response = ORJSONResponse(
                     status_code=401,
-                    detail="Invalid API key",
+                    content={"detail": "Invalid API key"},
                     headers={"WWW-Authenticate": "Bearer"},
                 )
+                await response(scope, receive, send)
+                return
 
         # Set tier in request state for downstream use
-        request.state.tier = tier
-        request.state.api_key = api_key
+        state = scope.setdefault("state", {})
+        state["tier"] = tier
+        state["api_key"] = api_key
 
         # Continue processing
-        response = await call_next(request)
-        return response
+        await self.app(scope, receive, send)
 
 
 # Helper function to get current tier from request
@@ -2,41 +2,43 @@
 
 import time
 from collections import defaultdict
+from typing import NamedTuple
 
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.core.config import settings
 from app.core.logging import log_rate_limit_exceeded
+from app.core.responses import ORJSONResponse
+from app.middleware.auth import BYPASS_PATHS
 
 
-class TierLimits:
-    """Rate limit configurations by tier."""
+class Limits(NamedTuple):
+    """Per-tier request quotas."""
+
+    per_minute: int
+    per_day: int
 
-    PUBLIC = {
-        "requests_per_minute": settings.rate_limit_public,
-        "requests_per_day": 500,
-    }
 
-    API_KEY = {
-        "requests_per_minute": settings.rate_limit_api_key,
-        "requests_per_day": 5000,
-    }
+# Built once at import time; looked up on every request
+TIER_LIMITS: dict[str, Limits] = {
+    "public": Limits(settings.rate_limit_public, 500),
+    "api_key": Limits(settings.rate_limit_api_key, 5000),
+    "partner": Limits(settings.rate_limit_partner, 50000),
+}
 
-    PARTNER = {
-        "requests_per_minute": settings.rate_limit_partner,
-        "requests_per_day": 50000,
-    }
+
+class TierLimits:
+    """Rate limit configurations by tier."""
+
+    PUBLIC = TIER_LIMITS["public"]
+    API_KEY = TIER_LIMITS["api_key"]
+    PARTNER = TIER_LIMITS["partner"]
 
     @classmethod
-    def get_limits(cls, tier: str) -> dict[str, int]:
-        """Get rate limits for a tier."""
-        if tier == "partner":
-            return cls.PARTNER
-        elif tier == "api_key":
-            return cls.API_KEY
-        else:
-            return cls.PUBLIC
+    def get_limits(cls, tier: str) -> Limits:
+        """Get rate limits for a tier (unknown tiers fall back to public)."""
+        return TIER_LIMITS.get(tier, cls.PUBLIC)
 
 
 class RateLimiter:
@@ -89,7 +91,7 @@ class RateLimiter:
                 - reset_at: float (Unix timestamp)
                 - retry_after: int (seconds, if blocked)
         """
-        limits = TierLimits.get_limits(tier)
+        minute_limit = TierLimits.get_limits(tier).per_minute
         now = time.time()
 
         # Clean old entries
@@ -99,7 +101,6 @@ class RateLimiter:
         minute_requests = sum(count for ts, count in self._memory_store[identifier]["minute"])
 
         # Check minute limit
-        minute_limit = limits["requests_per_minute"]
         reset_at = now + 60
 
         if minute_requests >= minute_limit:
@@ -155,6 +156,9 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
     async def dispatch(self, request: Request, call_next):
         """Process request and check rate limits."""
+        if request.url.path in BYPASS_PATHS:
+            return await call_next(request)
+
         # Get tier from request state (set by AuthMiddleware)
         tier = getattr(request.state, "tier", "public")
 
@@ -176,9 +180,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             )
 
             # Return 429 Too Many Requests
-            from fastapi.responses import JSONResponse
-
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=429,
                 content={
                     "error": "Rate limit exceeded",
@@ -4,6 +4,7 @@ import enum
 import uuid
 from collections.abc import AsyncGenerator
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
@@ -100,8 +101,14 @@ async_session_maker = None
 cleanup_scheduler = None
 
 
+@lru_cache(maxsize=1)
 def get_database_url() -> str:
-    """Get the appropriate async database URL."""
+    """
+    Get the appropriate async database URL.
+
+    Cached after the first call; call ``get_database_url.cache_clear()`` after
+    changing ``settings.database_url``.
+    """
     db_url = settings.database_url
 
     # Convert sync SQLite URL to async
@@ -167,7 +174,7 @@ async def cleanup_expired_records() -> dict[str, int]:
     Returns:
         Dictionary with counts of deleted results and metadata.
     """
-    from sqlalchemy import delete, select
+    from sqlalchemy import delete, func, select
 
     from app.core.logging import log_ttl_cleanup, log_ttl_cleanup_error
 
@@ -182,24 +189,23 @@ async def cleanup_expired_records() -> dict[str, int]:
             results_cutoff = now - timedelta(days=settings.ttl_results)
             metadata_cutoff = now - timedelta(days=settings.ttl_metadata)
 
-            # Find records to delete (based on last_accessed_at for results TTL)
-            stmt = select(Analysis).where(Analysis.last_accessed_at < results_cutoff)
-            result = await session.execute(stmt)
-            to_delete = result.scalars().all()
-
-            deleted_count = len(to_delete)
-            oldest_date = min([r.last_accessed_at for r in to_delete], default=None)
+            # Oldest record being deleted (based on last_accessed_at for results TTL)
+            expired = Analysis.last_accessed_at < results_cutoff
+            oldest_date = await session.scalar(
+                select(func.min(Analysis.last_accessed_at)).where(expired)
+            )
 
             # Delete expired results
-            if deleted_count > 0:
-                delete_stmt = delete(Analysis).where(Analysis.last_accessed_at < results_cutoff)
-                await session.execute(delete_stmt)
+            deleted_count = 0
+            if oldest_date is not None:
+                result = await session.execute(delete(Analysis).where(expired))
+                deleted_count = result.rowcount
                 await session.commit()
 
             # Count old metadata (90+ days old) - for future aggregation
-            metadata_stmt = select(Analysis).where(Analysis.created_at < metadata_cutoff)
-            metadata_result = await session.execute(metadata_stmt)
-            old_metadata_count = len(metadata_result.scalars().all())
+            old_metadata_count = await session.scalar(
+                select(func.count(Analysis.id)).where(Analysis.created_at < metadata_cutoff)
+            )
 
             # Log cleanup event
             log_ttl_cleanup(
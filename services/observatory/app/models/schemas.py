@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AnalysisOptions(BaseModel):
@@ -29,6 +29,8 @@ class AnalysisRequest(BaseModel):
 class PatternData(BaseModel):
     """Detected pattern data."""
 
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
+
     dialectic: list[dict[str, Any]] = Field(default_factory=list)
     sentiment: dict[str, Any] = Field(default_factory=dict)
     topics: list[str] = Field(default_factory=list)
@@ -36,7 +38,14 @@ class PatternData(BaseModel):
 
 
 class AnalysisResponse(BaseModel):
-    """Response containing analysis results."""
+    """
+    Response containing analysis results.
+
+    Built with ``model_construct`` from stored rows, which are already typed;
+    validation only runs for untrusted input.
+    """
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
 
     id: str = Field(..., description="Unique analysis identifier")
     status: str = Field(
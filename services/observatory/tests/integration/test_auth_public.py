@@ -98,6 +98,15 @@ async def test_public_tier_access_no_auth(client):
     assert response.status_code == 200
 
 
+@pytest.mark.asyncio
+async def test_invalid_api_key_rejected(client):
+    """Test that an unknown Bearer token is rejected with 401."""
+    response = await client.get("/", headers={"Authorization": "Bearer not-a-real-key"})
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Invalid API key"
+    assert response.headers["WWW-Authenticate"] == "Bearer"
+
+
 @pytest.mark.asyncio
 async def test_public_tier_rate_limits(client):
     """
@@ -111,7 +120,7 @@ async def test_public_tier_rate_limits(client):
     # Make (limit + 1) requests rapidly
     responses = []
     for i in range(limit + 1):
-        response = await client.get("/health")
+        response = await client.get("/")
         responses.append(response)
 
     # First {limit} should succeed
@@ -124,7 +133,7 @@ async def test_public_tier_rate_limits(client):
 @pytest.mark.asyncio
 async def test_public_tier_rate_limit_headers(client):
     """Test that rate limit headers are present and match configuration."""
-    response = await client.get("/health")
+    response = await client.get("/")
 
     assert "X-RateLimit-Limit" in response.headers
     assert "X-RateLimit-Remaining" in response.headers
@@ -132,3 +141,15 @@ async def test_public_tier_rate_limit_headers(client):
 
     # Public tier should have configured limit
     assert int(response.headers["X-RateLimit-Limit"]) == settings.rate_limit_public
+
+
+@pytest.mark.asyncio
+async def test_health_bypasses_rate_limiting(client):
+    """Test that health probes are neither rate limited nor counted."""
+    for _ in range(settings.rate_limit_public + 1):
+        response = await client.get("/health")
+        assert response.status_code == 200
+        assert "X-RateLimit-Limit" not in response.headers
+
+    response = await client.get("/")
+    assert int(response.headers["X-RateLimit-Remaining"]) == settings.rate_limit_public - 1
@@ -1,6 +1,13 @@
 """Unit tests for API key authentication."""
 
-from app.middleware.auth import generate_api_key, hash_api_key, validate_api_key
+from app.middleware.auth import (
+    API_KEY_REGISTRY,
+    generate_api_key,
+    hash_api_key,
+    lookup_api_key,
+    register_api_key,
+    validate_api_key,
+)
 
 
 def test_api_key_generation():
@@ -17,8 +24,8 @@ def test_api_key_hashing():
     key = "test_api_key_12345"
     hashed = hash_api_key(key)
 
-    assert hashed != key  # Should be hashed
-    assert len(hashed) == 64  # SHA256 hex digest length
+    assert isinstance(hashed, bytes)
+    assert len(hashed) == 32  # Raw SHA256 digest length
 
     # Same key should produce same hash
     assert hash_api_key(key) == hashed
@@ -58,3 +65,20 @@ def test_validate_api_key_none():
 
     result = validate_api_key(None, valid_keys)
     assert result is False
+
+
+def test_lookup_api_key_returns_tier():
+    """Test lookup resolves a registered key to its tier."""
+    key = generate_api_key()
+    register_api_key(key, tier="partner")
+    try:
+        assert lookup_api_key(key) == "partner"
+    finally:
+        API_KEY_REGISTRY.pop(hash_api_key(key), None)
+
+
+def test_lookup_api_key_unknown():
+    """Test lookup returns None for unknown or empty keys."""
+    assert lookup_api_key("unregistered_key") is None
+    assert lookup_api_key("") is None
+    assert lookup_api_key(None) is None
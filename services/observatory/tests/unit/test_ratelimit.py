@@ -11,22 +11,27 @@ from app.middleware.ratelimit import RateLimiter, TierLimits
 def test_tier_limits_public():
     """Test public tier limits match configuration."""
     limits = TierLimits.PUBLIC
-    assert limits["requests_per_minute"] == settings.rate_limit_public
-    assert limits["requests_per_day"] == 500
+    assert limits.per_minute == settings.rate_limit_public
+    assert limits.per_day == 500
 
 
 def test_tier_limits_api_key():
     """Test API key tier limits match configuration."""
     limits = TierLimits.API_KEY
-    assert limits["requests_per_minute"] == settings.rate_limit_api_key
-    assert limits["requests_per_day"] == 5000
+    assert limits.per_minute == settings.rate_limit_api_key
+    assert limits.per_day == 5000
 
 
 def test_tier_limits_partner():
     """Test partner tier limits match configuration."""
     limits = TierLimits.PARTNER
-    assert limits["requests_per_minute"] == settings.rate_limit_partner
-    assert limits["requests_per_day"] == 50000
+    assert limits.per_minute == settings.rate_limit_partner
+    assert limits.per_day == 50000
+
+
+def test_get_limits_unknown_tier_falls_back_to_public():
+    """Test unknown tiers receive public tier limits."""
+    assert TierLimits.get_limits("unknown") is TierLimits.PUBLIC
 
 
 @pytest.mark.asyncio